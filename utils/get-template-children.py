@@ -1,11 +1,17 @@
 import re
+import sys
+from pathlib import Path
 
-data = open("resources/asampo.ui").read()
+TEMPLATE_CHILD_RE = re.compile(rb'class="([^"]+)" id="([^"-][^"]*)"')
 
-for x in re.findall(r'class="(.+?)" id="(.+?)"', data):
-    if x[1][0] == "-":
-        continue
+data = Path("resources/asampo.ui").read_bytes()
+out = []
 
-    print(f"    #[template_child(id = \"{x[1]}\")]")
-    print(f"    pub {x[1].replace('-', '_')}: gtk::TemplateChild<gtk::{x[0][3:]}>,")
-    print()
+for cls, ident in TEMPLATE_CHILD_RE.findall(data):
+    cls, ident = cls.decode(), ident.decode()
+    out.append(f"    #[template_child(id = \"{ident}\")]")
+    out.append(f"    pub {ident.replace('-', '_')}: gtk::TemplateChild<gtk::{cls[3:]}>,")
+    out.append("")
+
+if out:
+    sys.stdout.write("\n".join(out) + "\n")